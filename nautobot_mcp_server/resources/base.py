@@ -3,8 +3,6 @@
 import json
 from typing import Any
 
-import yaml
-
 
 class NautobotResourceBase:
     """Base class for Nautobot resource implementations."""
@@ -19,6 +17,9 @@ class NautobotResourceBase:
         Returns:
             YAML-formatted string
         """
+        # Imported on first use; no resource currently renders YAML, so the server never pays for it at startup
+        import yaml
+
         return yaml.dump(data, default_flow_style=False, sort_keys=False, allow_unicode=True, indent=2)
 
     @staticmethod
@@ -4,10 +4,25 @@ from typing import Optional
 
 import pynautobot
 from mcp.server.fastmcp import FastMCP
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 from .resources import register_all_resources
 from .tools import register_all_tools
 
+# Keep-alive connections per host; covers pynautobot's threaded pagination plus concurrent tool lookups
+HTTP_POOL_MAXSIZE = 16
+
+# Retry transient gateway errors and rate limiting quickly (0.2s, 0.4s, 0.8s). POST is left out so a create that
+# reached Nautobot is never sent twice; connection errors before a request is sent are retried for every method.
+HTTP_RETRY = Retry(
+    total=3,
+    backoff_factor=0.2,
+    status_forcelist=(429, 502, 503, 504),
+    allowed_methods=frozenset({"GET", "HEAD", "OPTIONS", "PUT", "PATCH", "DELETE"}),
+    raise_on_status=False,
+)
+
 
 class NautobotMCPServer:
     """MCP Server for Nautobot API operations."""
@@ -33,9 +48,22 @@ class NautobotMCPServer:
     def _get_client(self) -> pynautobot.api:
         """Get or create Nautobot client."""
         if not self.nautobot_client:
+            # retries covers the version check the constructor sends; the adapter mounted below replaces it afterwards
             self.nautobot_client = pynautobot.api(self.url, token=self.token, threading=True, retries=3)
+            self._mount_http_adapter(self.nautobot_client.http_session)
         return self.nautobot_client
 
+    @staticmethod
+    def _mount_http_adapter(session):
+        """Mount a pooled, retrying adapter on the client's HTTP session.
+
+        Args:
+            session: The requests.Session used by the pynautobot client
+        """
+        adapter = HTTPAdapter(pool_maxsize=HTTP_POOL_MAXSIZE, max_retries=HTTP_RETRY)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
     def get_fastmcp_instance(self) -> FastMCP:
         """Get the FastMCP instance for running the server."""
         return self.mcp
@@ -1,14 +1,38 @@
 """Base class for Nautobot MCP tools."""
 
+import atexit
 import json
-from typing import Any, Optional
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
 
 from mcp.server.fastmcp import Context
+from pynautobot.core.query import Request
+
+# Compact encoder shared by all responses; json.dumps() would build a new encoder per call
+_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+logger = logging.getLogger(__name__)
+
+# Shared by all tools so concurrent lookups reuse warm worker threads
+_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="nautobot-mcp")
+atexit.register(_EXECUTOR.shutdown)
+
+# Seconds to reuse a resolved reference-data ID (statuses, types, ...) before looking it up again
+LOOKUP_CACHE_TTL = 60.0
+
+# Most IDs kept per tool instance; the oldest entries are dropped first so the cache cannot grow without bound
+LOOKUP_CACHE_MAXSIZE = 512
 
 
 class NautobotToolBase:
     """Base class for Nautobot tool implementations."""
 
+    _executor = _EXECUTOR
+
     def __init__(self, client_getter):
         """Initialize the tool base.
 
@@ -16,6 +40,8 @@ class NautobotToolBase:
             client_getter: Callable that returns a pynautobot client
         """
         self._get_client = client_getter
+        self._lookup_cache: OrderedDict[tuple, tuple[float, str]] = OrderedDict()
+        self._lookup_lock = threading.Lock()
 
     @staticmethod
     def format_error(error_msg: str) -> str:
@@ -27,7 +53,7 @@ class NautobotToolBase:
         Returns:
             JSON formatted error string
         """
-        return json.dumps({"error": error_msg}, separators=(",", ":"))
+        return _JSON_ENCODER.encode({"error": error_msg})
 
     @staticmethod
     def format_success(data: Any, message: Optional[str] = None) -> str:
@@ -41,8 +67,161 @@ class NautobotToolBase:
             JSON formatted success response
         """
         if message:
-            return json.dumps({"success": True, "message": message, "data": data}, separators=(",", ":"))
-        return json.dumps(data, separators=(",", ":"))
+            return _JSON_ENCODER.encode({"success": True, "message": message, "data": data})
+        return _JSON_ENCODER.encode(data)
+
+    @staticmethod
+    def looks_like_uuid(value: str) -> bool:
+        """Check whether an object identifier is a UUID rather than a name.
+
+        Only the canonical hyphenated shape is checked, which is enough to tell IDs apart from names.
+
+        Args:
+            value: Object identifier passed to a tool
+
+        Returns:
+            True if the identifier has the shape of a UUID
+        """
+        return isinstance(value, str) and len(value) == 36 and value[8] == value[13] == value[18] == value[23] == "-"
+
+    @classmethod
+    def _id_or_name_filter(cls, identifier: str) -> dict[str, str]:
+        """Build the get() filter for an identifier that may be an ID or a name.
+
+        Only UUIDs can match by ID, so any other identifier goes straight to the name lookup.
+
+        Args:
+            identifier: Object ID (UUID) or name
+
+        Returns:
+            {"id": identifier} for UUIDs, otherwise {"name": identifier}
+        """
+        if cls.looks_like_uuid(identifier):
+            return {"id": identifier}
+        return {"name": identifier}
+
+    @classmethod
+    def get_record(cls, endpoint, identifier: str, **kwargs):
+        """Get a single record by ID or name.
+
+        Args:
+            endpoint: pynautobot endpoint to query (e.g. client.dcim.locations)
+            identifier: Object ID (UUID) or name
+            **kwargs: Extra query parameters such as depth
+
+        Returns:
+            The matching record, or None if nothing matched
+        """
+        return endpoint.get(**cls._id_or_name_filter(identifier), **kwargs)
+
+    @staticmethod
+    def delete_by_id(endpoint, object_id: str) -> bool:
+        """Delete a single object by ID without fetching it first.
+
+        Args:
+            endpoint: pynautobot endpoint the object belongs to (e.g. client.dcim.locations)
+            object_id: Object ID (UUID)
+
+        Returns:
+            True if the DELETE request succeeded
+
+        Raises:
+            RequestError: If the API rejects the request, including 404 for unknown IDs
+        """
+        return endpoint.return_obj({"id": object_id}, endpoint.api, endpoint).delete()
+
+    @staticmethod
+    def update_by_id(endpoint, object_id: str, data: dict[str, Any]):
+        """Update a single object by ID without fetching it first.
+
+        Endpoint.update() discards the PATCH response, so the request is sent directly to keep the updated record.
+
+        Args:
+            endpoint: pynautobot endpoint the object belongs to (e.g. client.dcim.locations)
+            object_id: Object ID (UUID)
+            data: Fields to change
+
+        Returns:
+            The updated record
+
+        Raises:
+            RequestError: If the API rejects the request, including 404 for unknown IDs
+        """
+        req = Request(
+            key=object_id,
+            base=endpoint.url,
+            token=endpoint.api.token,
+            http_session=endpoint.api.http_session,
+            api_version=endpoint.api.api_version,
+        )
+        return endpoint.return_obj(req.patch(data), endpoint.api, endpoint)
+
+    def resolve_id(self, endpoint_path: str, **filters) -> Optional[str]:
+        """Resolve an object to its ID, reusing recent results.
+
+        Results are cached per tool instance for LOOKUP_CACHE_TTL seconds, keeping at most LOOKUP_CACHE_MAXSIZE
+        entries. Misses are not cached.
+
+        Args:
+            endpoint_path: Dotted app and endpoint name (e.g. "extras.statuses")
+            **filters: Lookup passed to the endpoint's get() (e.g. name="Active")
+
+        Returns:
+            The object ID, or None if nothing matched
+        """
+        key = (endpoint_path, *sorted(filters.items()))
+        now = time.monotonic()
+        cached = self._lookup_cache.get(key)
+        if cached and cached[0] > now:
+            return cached[1]
+
+        app_name, endpoint_name = endpoint_path.split(".")
+        record = getattr(getattr(self._get_client(), app_name), endpoint_name).get(**filters)
+        if not record:
+            return None
+
+        with self._lookup_lock:
+            self._lookup_cache[key] = (now + LOOKUP_CACHE_TTL, record.id)
+            self._lookup_cache.move_to_end(key)
+            # Entries share one TTL and are kept in insertion order, so expired ones are always evicted first
+            while len(self._lookup_cache) > LOOKUP_CACHE_MAXSIZE:
+                self._lookup_cache.popitem(last=False)
+        return record.id
+
+    def resolve_id_or_name(self, endpoint_path: str, identifier: str) -> Optional[str]:
+        """Resolve an object given either its ID or its name.
+
+        Args:
+            endpoint_path: Dotted app and endpoint name (e.g. "dcim.location_types")
+            identifier: Object ID (UUID) or name
+
+        Returns:
+            The object ID, or None if nothing matched
+        """
+        return self.resolve_id(endpoint_path, **self._id_or_name_filter(identifier))
+
+    def invalidate_lookups(self, endpoint_path: str):
+        """Drop cached IDs for an endpoint after its objects change.
+
+        Args:
+            endpoint_path: Dotted app and endpoint name (e.g. "dcim.locations")
+        """
+        with self._lookup_lock:
+            for key in [key for key in self._lookup_cache if key[0] == endpoint_path]:
+                del self._lookup_cache[key]
+
+    @staticmethod
+    def _debug(ctx: Context, message: Callable[[], str]):
+        """Send a debug message to the client only when debug logging is enabled.
+
+        The message is built lazily so f-string formatting is skipped on the normal (non --debug) path.
+
+        Args:
+            ctx: MCP context
+            message: Callable returning the message text
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            ctx.debug(message())
 
     def log_and_return_error(self, ctx: Context, operation: str, error: Exception) -> str:
         """Log an error and return formatted error response.
@@ -114,10 +114,10 @@ class DeviceTools(NautobotToolBase):
                 # Try to get by ID first (UUID)
                 try:
                     device = devices.get(id=device_id, depth=depth)
-                    ctx.debug(f"Found device by ID: {device_id}")
+                    self._debug(ctx, lambda: f"Found device by ID: {device_id}")
                 except RequestError:
                     # If not found by ID, try by name
-                    ctx.debug(f"Searching device by name: {device_id}")
+                    self._debug(ctx, lambda: f"Searching device by name: {device_id}")
                     device = devices.get(name=device_id, depth=depth)
 
                 if device:
@@ -234,7 +234,7 @@ class DeviceTools(NautobotToolBase):
                 # Get the device
                 try:
                     device = devices.get(id=device_id)
-                    ctx.debug(f"Found device by ID: {device_id}")
+                    self._debug(ctx, lambda: f"Found device by ID: {device_id}")
                 except RequestError:
                     ctx.warning(f"Device not found: {device_id}")
                     return self.format_error(f"Device not found: {device_id}")
@@ -295,8 +295,8 @@ class DeviceTools(NautobotToolBase):
                 # Get the device
                 try:
                     device = devices.get(id=device_id)
-                    ctx.debug(f"Found device by ID: {device_id}")
-                except Exception:
+                    self._debug(ctx, lambda: f"Found device by ID: {device_id}")
+                except RequestError:
                     ctx.warning(f"Device not found: {device_id}")
                     return self.format_error(f"Device not found: {device_id}")
 
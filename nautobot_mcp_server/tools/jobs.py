@@ -3,6 +3,7 @@
 from typing import Any, Optional
 
 from mcp.server.fastmcp import Context, FastMCP
+from pynautobot import RequestError
 
 from .base import NautobotToolBase
 
@@ -76,15 +77,15 @@ class JobTools(NautobotToolBase):
                 # Try to get by ID first (UUID)
                 try:
                     job = jobs.get(job_id)
-                    ctx.debug(f"Found job by ID: {job_id}")
-                except Exception:
+                    self._debug(ctx, lambda: f"Found job by ID: {job_id}")
+                except RequestError:
                     # If not found by ID, search by name or slug
                     all_jobs = jobs.all()
                     job = None
                     for j in all_jobs:
                         if j.name == job_id or (hasattr(j, "slug") and j.slug == job_id):
                             job = j
-                            ctx.debug(f"Found job by name/slug: {job_id}")
+                            self._debug(ctx, lambda: f"Found job by name/slug: {job_id}")
                             break
 
                 if job:
@@ -133,18 +134,18 @@ class JobTools(NautobotToolBase):
                 jobs = client.extras.jobs
 
                 # Get the job
-                ctx.debug(f"Looking up job: {job_name}")
+                self._debug(ctx, lambda: f"Looking up job: {job_name}")
                 try:
                     job = jobs.get(job_name)
-                    ctx.debug(f"Found job by ID: {job_name}")
-                except Exception:
+                    self._debug(ctx, lambda: f"Found job by ID: {job_name}")
+                except RequestError:
                     # Search by name or slug
                     all_jobs = jobs.all()
                     job = None
                     for j in all_jobs:
                         if j.name == job_name or (hasattr(j, "slug") and j.slug == job_name):
                             job = j
-                            ctx.debug(f"Found job by name/slug: {job_name}")
+                            self._debug(ctx, lambda: f"Found job by name/slug: {job_name}")
                             break
 
                 if not job:
@@ -7,6 +7,51 @@ from pynautobot import RequestError
 
 from .base import NautobotToolBase
 
+# Optional create fields that are passed through to the API unchanged
+_OPTIONAL_FIELDS = (
+    "description",
+    "facility",
+    "asn",
+    "time_zone",
+    "physical_address",
+    "shipping_address",
+    "latitude",
+    "longitude",
+    "contact_name",
+    "contact_phone",
+    "contact_email",
+)
+
+# Keys accepted on each entry of a bulk create; type and status are shared by the whole batch
+_BULK_ENTRY_FIELDS = frozenset({"name", "parent", *_OPTIONAL_FIELDS})
+
+# Optional list filters that are passed through to the API when provided
+_LIST_FILTERS = ("location_type", "status", "parent", "tenant")
+
+
+def _serialize_location_row(location) -> dict[str, Any]:
+    """Build the abbreviated location summary returned by the list tool.
+
+    Args:
+        location: pynautobot location record
+
+    Returns:
+        Dictionary of the location fields included in list results
+    """
+    return {
+        "id": str(location.id),
+        "name": location.name,
+        "natural_slug": getattr(location, "natural_slug", None),
+        "tree_depth": getattr(location, "tree_depth", None),
+        "status": str(location.status),
+        "location_type": str(type_obj) if (type_obj := getattr(location, "location_type", None)) else None,
+        "parent": str(parent_obj) if (parent_obj := getattr(location, "parent", None)) else None,
+        "facility": getattr(location, "facility", None),
+        "description": getattr(location, "description", None),
+        "time_zone": getattr(location, "time_zone", None),
+        "physical_address": getattr(location, "physical_address", None),
+    }
+
 
 class LocationTools(NautobotToolBase):
     """Tools for managing locations in Nautobot."""
@@ -25,6 +70,9 @@ class LocationTools(NautobotToolBase):
             limit: int = 50,
             offset: int | None = None,
             location_type: str = None,
+            status: str | None = None,
+            parent: str | None = None,
+            tenant: str | None = None,
         ) -> str:
             """List all locations in Nautobot.
 
@@ -37,44 +85,27 @@ class LocationTools(NautobotToolBase):
                 limit: Number of devices per page; pynautobot will return all devices unless offset is used.
                 offset: Offset for pagination; if None, will return all devices.
                 location_type: Location type name or ID to filter by (optional).
+                status: Location status name or ID to filter by (optional).
+                parent: Parent location name or ID to filter by (optional).
+                tenant: Tenant name or ID to filter by (optional).
 
             Returns:
                 JSON string of location list
             """
             ctx.info(
-                f"Listing locations (depth={depth}, limit={limit}, offset={offset}, location_type={location_type})"
+                f"Listing locations (depth={depth}, limit={limit}, offset={offset}, location_type={location_type}, "
+                f"status={status}, parent={parent}, tenant={tenant})"
             )
 
             try:
-                client = self._get_client()
-                locations_query = client.dcim.locations
+                params = locals()
+                filters = {name: params[name] for name in _LIST_FILTERS if params[name]}
 
-                kwargs = {}
-                if location_type:
-                    kwargs["location_type"] = location_type
-                locations = locations_query.filter(depth=depth, limit=limit, offset=offset, **kwargs)
+                client = self._get_client()
+                locations = client.dcim.locations.filter(depth=depth, limit=limit, offset=offset, **filters)
 
                 # Build abbreviated list to help with potential token size limitations
-                result = []
-                for location in locations:
-                    location_info = {
-                        "id": str(location.id),
-                        "name": location.name,
-                        "natural_slug": location.natural_slug if hasattr(location, "natural_slug") else None,
-                        "tree_depth": location.tree_depth if hasattr(location, "tree_depth") else None,
-                        "status": str(location.status),
-                        "location_type": str(location.location_type)
-                        if hasattr(location, "location_type") and location.location_type
-                        else None,
-                        "parent": str(location.parent) if hasattr(location, "parent") and location.parent else None,
-                        "facility": location.facility if hasattr(location, "facility") else None,
-                        "description": location.description if hasattr(location, "description") else None,
-                        "time_zone": location.time_zone if hasattr(location, "time_zone") else None,
-                        "physical_address": location.physical_address
-                        if hasattr(location, "physical_address")
-                        else None,
-                    }
-                    result.append(location_info)
+                result = [_serialize_location_row(location) for location in locations]
 
                 ctx.info(f"Found {len(result)} locations")
                 return self.format_success(result)
@@ -88,7 +119,7 @@ class LocationTools(NautobotToolBase):
 
             Args:
                 ctx: MCP context for logging and progress
-                location_id: Location ID (UUID), name, or natural_slug
+                location_id: Location ID (UUID) or name
                 depth: Depth of the device details to return; default returns 1 level of nested objects.
 
             Returns:
@@ -98,15 +129,7 @@ class LocationTools(NautobotToolBase):
 
             try:
                 client = self._get_client()
-                locations = client.dcim.locations
-
-                # Try to get by ID first (UUID)
-                try:
-                    location = locations.get(id=location_id, depth=depth)
-                    ctx.debug(f"Found location by ID: {location_id}")
-                except Exception:
-                    location = locations.get(name=location_id, depth=depth)
-                    ctx.debug(f"Found location by name: {location_id}")
+                location = self.get_record(client.dcim.locations, location_id, depth=depth)
 
                 if location:
                     ctx.info(f"Successfully retrieved location: {location.name}")
@@ -163,56 +186,43 @@ class LocationTools(NautobotToolBase):
             ctx.info(f"Creating location: {name}")
 
             try:
-                # Capture function parameters before defining other locals
-                params = locals().copy()
-                params.pop("ctx")
-                params.pop("self")
+                # Collect the optional fields that were provided
+                params = locals()
+                optional_data = {field: params[field] for field in _OPTIONAL_FIELDS if params[field] is not None}
 
                 client = self._get_client()
 
-                # Get status object
-                ctx.debug(f"Looking up status: {status}")
-                status_obj = client.extras.statuses.get(name=status)
-                if not status_obj:
+                # The status, location type and parent lookups are independent, so run them concurrently
+                self._debug(
+                    ctx, lambda: f"Looking up status: {status}, location type: {location_type}, parent: {parent}"
+                )
+                status_future = self._executor.submit(self.resolve_id, "extras.statuses", name=status)
+                location_type_future = self._executor.submit(
+                    self.resolve_id_or_name, "dcim.location_types", location_type
+                )
+                parent_future = (
+                    self._executor.submit(self.resolve_id_or_name, "dcim.locations", parent) if parent else None
+                )
+
+                status_id = status_future.result()
+                if not status_id:
                     ctx.error(f"Status not found: {status}")
                     return self.format_error(f"Status not found: {status}")
 
-                # Get location type object
-                ctx.debug(f"Looking up location type: {location_type}")
-                location_type_obj = None
-                try:
-                    location_type_obj = client.dcim.location_types.get(id=location_type)
-                except Exception:
-                    try:
-                        location_type_obj = client.dcim.location_types.get(name=location_type)
-                    except Exception:
-                        ctx.debug(f"Location type lookup failed for: {location_type}")
-
-                if not location_type_obj:
+                location_type_id = location_type_future.result()
+                if not location_type_id:
                     ctx.error(f"Location type not found: {location_type}")
                     return self.format_error(f"Location type not found: {location_type}")
 
-                # Get parent location if specified
-                parent_obj = None
-                if parent:
-                    ctx.debug(f"Looking up parent location: {parent}")
-                    try:
-                        parent_obj = client.dcim.locations.get(id=parent)
-                    except Exception:
-                        try:
-                            parent_obj = client.dcim.locations.get(name=parent)
-                        except Exception:
-                            ctx.error(f"Parent location not found: {parent}")
-                            return self.format_error(f"Parent location not found: {parent}")
-
-                # Build location data from non-None parameters
-                location_data = {k: v for k, v in params.items() if v is not None}
-
-                # Override with resolved objects
-                location_data["location_type"] = location_type_obj.id
-                location_data["status"] = status_obj.id
-                if parent_obj:
-                    location_data["parent"] = parent_obj.id
+                parent_id = parent_future.result() if parent_future else None
+                if parent and not parent_id:
+                    ctx.error(f"Parent location not found: {parent}")
+                    return self.format_error(f"Parent location not found: {parent}")
+
+                # Build location data from the resolved IDs and provided optional fields
+                location_data = {"name": name, "location_type": location_type_id, "status": status_id, **optional_data}
+                if parent_id:
+                    location_data["parent"] = parent_id
 
                 ctx.info(f"Creating location with data: {location_data}")
                 new_location = client.dcim.locations.create(**location_data)
@@ -220,7 +230,7 @@ class LocationTools(NautobotToolBase):
                 location_info = {
                     "id": str(new_location.id),
                     "name": new_location.name,
-                    "natural_slug": new_location.natural_slug if hasattr(new_location, "natural_slug") else None,
+                    "natural_slug": getattr(new_location, "natural_slug", None),
                     "status": str(new_location.status),
                     "location_type": str(new_location.location_type),
                     "created": str(new_location.created),
@@ -246,7 +256,7 @@ class LocationTools(NautobotToolBase):
 
             Args:
                 ctx: MCP context for logging and progress
-                location_id: Location ID (UUID); must GET location first if you don't know the ID.
+                location_id: Location ID (UUID) or name
                 updates: Field updates dict. Set None to clear fields.
 
             Returns:
@@ -255,20 +265,11 @@ class LocationTools(NautobotToolBase):
             ctx.info(f"Updating location: {location_id}")
 
             try:
-                client = self._get_client()
-                locations = client.dcim.locations
-
-                # Get the location
-                try:
-                    location = locations.get(id=location_id)
-                    ctx.debug(f"Found location by ID: {location_id}")
-                except RequestError:
-                    ctx.warning(f"Location not found: {location_id}")
-                    return self.format_error(f"Location not found: {location_id}")
-
-                # Validate that updates is a dictionary
+                # Validate updates before any API calls so bad input never costs a round trip
                 if not isinstance(updates, dict):
                     return self.format_error("Updates parameter must be a dictionary")
+                if not updates:
+                    return self.format_error("No fields to update")
 
                 # Log fields being updated, including None values
                 fields_to_update = list(updates.keys())
@@ -283,13 +284,35 @@ class LocationTools(NautobotToolBase):
                 if "status" in updates and updates["status"] is not None:
                     updates["status"] = updates["status"].capitalize()
 
-                ctx.info(f"Updating location with data: {updates}")
-                location.update(updates)
+                client = self._get_client()
+                locations = client.dcim.locations
+
+                # A UUID can be patched directly, without fetching the record first
+                if self.looks_like_uuid(location_id):
+                    ctx.info(f"Updating location with data: {updates}")
+                    try:
+                        location = self.update_by_id(locations, location_id, updates)
+                    except RequestError as e:
+                        if e.req.status_code != 404:
+                            raise
+                        ctx.warning(f"Location not found: {location_id}")
+                        return self.format_error(f"Location not found: {location_id}")
+                else:
+                    location = self.get_record(locations, location_id)
+
+                    if not location:
+                        ctx.warning(f"Location not found: {location_id}")
+                        return self.format_error(f"Location not found: {location_id}")
+
+                    ctx.info(f"Updating location with data: {updates}")
+                    location.update(updates)
+
+                self.invalidate_lookups("dcim.locations")
 
                 location_info = {
                     "id": str(location.id),
                     "name": location.name,
-                    "natural_slug": location.natural_slug if hasattr(location, "natural_slug") else None,
+                    "natural_slug": getattr(location, "natural_slug", None),
                     "status": str(location.status),
                     "updated_fields": fields_to_update,
                     "cleared_fields": fields_to_clear,
@@ -307,10 +330,10 @@ class LocationTools(NautobotToolBase):
 
             Args:
                 ctx: MCP context for logging and progress
-                location_id: Location ID (UUID)
+                location_id: Location ID (UUID) or name
 
             Returns:
-                JSON string confirming deletion
+                JSON string confirming deletion; deleting by ID reports the ID instead of the name
             """
             ctx.info(f"Deleting location: {location_id}")
 
@@ -318,16 +341,31 @@ class LocationTools(NautobotToolBase):
                 client = self._get_client()
                 locations = client.dcim.locations
 
-                # Get the location
-                try:
-                    location = locations.get(location_id)
-                    ctx.debug(f"Found location by ID: {location_id}")
-                except Exception:
+                # A UUID can be deleted directly, without fetching the record first
+                if self.looks_like_uuid(location_id):
+                    try:
+                        self.delete_by_id(locations, location_id)
+                    except RequestError as e:
+                        if e.req.status_code != 404:
+                            raise
+                        ctx.warning(f"Location not found: {location_id}")
+                        return self.format_error(f"Location not found: {location_id}")
+                    self.invalidate_lookups("dcim.locations")
+
+                    ctx.info(f"Successfully deleted location: {location_id}")
+                    return self.format_success(
+                        {"deleted": location_id}, message=f"Location '{location_id}' deleted successfully"
+                    )
+
+                location = self.get_record(locations, location_id)
+
+                if not location:
                     ctx.warning(f"Location not found: {location_id}")
                     return self.format_error(f"Location not found: {location_id}")
 
                 location_name = location.name
                 location.delete()
+                self.invalidate_lookups("dcim.locations")
 
                 ctx.info(f"Successfully deleted location: {location_id}:{location_name}")
                 return self.format_success(
@@ -336,3 +374,90 @@ class LocationTools(NautobotToolBase):
 
             except Exception as e:
                 return self.log_and_return_error(ctx, "deleting location", e)
+
+        @mcp.tool()
+        def nautobot_bulk_create_locations(
+            ctx: Context,
+            locations: list[dict[str, Any]],
+            location_type: str,
+            status: str = "active",
+        ) -> str:
+            """Create several locations of the same type and status in a single request.
+
+            Args:
+                ctx: MCP context for logging and progress
+                locations: Location dicts, each with a "name" and optionally a "parent" name or ID plus any
+                    optional field accepted by nautobot_create_location (description, facility, asn, ...).
+                    Other keys are rejected. A parent must already exist; it cannot be another location in
+                    the same batch.
+                location_type: Location type name or ID shared by all locations
+                status: Location status shared by all locations (default: "active")
+
+            Returns:
+                JSON string of created location IDs and names
+            """
+            ctx.info(f"Bulk creating locations of type: {location_type}")
+
+            try:
+                if not isinstance(locations, list) or not locations:
+                    return self.format_error("Locations parameter must be a non-empty list")
+                for entry in locations:
+                    if not isinstance(entry, dict) or not entry.get("name"):
+                        return self.format_error("Each location must be a dictionary with a name")
+                    unknown_fields = sorted(entry.keys() - _BULK_ENTRY_FIELDS)
+                    if unknown_fields:
+                        return self.format_error(
+                            f"Unsupported fields for location {entry['name']}: {', '.join(unknown_fields)}"
+                        )
+
+                client = self._get_client()
+
+                # Shared lookups run once for the whole batch, and each distinct parent is resolved once
+                parents = {entry["parent"] for entry in locations if entry.get("parent")}
+                self._debug(
+                    ctx, lambda: f"Looking up status: {status}, location type: {location_type}, parents: {parents}"
+                )
+                status_future = self._executor.submit(self.resolve_id, "extras.statuses", name=status)
+                location_type_future = self._executor.submit(
+                    self.resolve_id_or_name, "dcim.location_types", location_type
+                )
+                parent_futures = {
+                    parent: self._executor.submit(self.resolve_id_or_name, "dcim.locations", parent)
+                    for parent in parents
+                }
+
+                status_id = status_future.result()
+                if not status_id:
+                    ctx.error(f"Status not found: {status}")
+                    return self.format_error(f"Status not found: {status}")
+
+                location_type_id = location_type_future.result()
+                if not location_type_id:
+                    ctx.error(f"Location type not found: {location_type}")
+                    return self.format_error(f"Location type not found: {location_type}")
+
+                parent_ids = {parent: future.result() for parent, future in parent_futures.items()}
+                missing_parents = sorted(parent for parent, parent_id in parent_ids.items() if not parent_id)
+                if missing_parents:
+                    ctx.error(f"Parent locations not found: {missing_parents}")
+                    return self.format_error(f"Parent locations not found: {', '.join(missing_parents)}")
+
+                # Build one payload per location from the shared IDs and that location's optional fields
+                location_data = []
+                for entry in locations:
+                    data = {"name": entry["name"], "location_type": location_type_id, "status": status_id}
+                    data.update({field: entry[field] for field in _OPTIONAL_FIELDS if entry.get(field) is not None})
+                    if entry.get("parent"):
+                        data["parent"] = parent_ids[entry["parent"]]
+                    location_data.append(data)
+
+                ctx.info(f"Creating {len(location_data)} locations in one request")
+                new_locations = client.dcim.locations.create(location_data)
+
+                result = [{"id": str(location.id), "name": location.name} for location in new_locations]
+
+                ctx.info(f"Successfully created {len(result)} locations")
+                return self.format_success(result, message=f"{len(result)} locations created successfully")
+
+            except Exception as e:
+                return self.log_and_return_error(ctx, "bulk creating locations", e)
@@ -1,6 +1,11 @@
 """Shared test utilities and fixtures."""
 
-from unittest.mock import MagicMock
+import json
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+from pynautobot import RequestError
 
 
 class MockRecord:
@@ -12,6 +17,7 @@ class MockRecord:
     def __init__(self, **kwargs):
         """Initialize mock record with given attributes."""
         self._data = kwargs
+        self._serialized = None
         for key, value in kwargs.items():
             setattr(self, key, value)
 
@@ -20,9 +26,14 @@ class MockRecord:
         if data:
             # Update internal data and attributes
             self._data.update(data)
+            self._serialized = None
             for key, value in data.items():
                 setattr(self, key, value)
 
+    def __copy__(self):
+        """Copy the record with its own data, so updating the copy never changes the original."""
+        return MockRecord(**self._data)
+
     def delete(self):
         """Mock delete method."""
         pass
@@ -33,7 +44,7 @@ class MockRecord:
         return MockRecord(
             id="job-result-123",
             name="Job Result",
-            status=MagicMock(__str__=lambda self: "Success"),
+            status="Success",
             created="2024-01-01T00:00:00Z",
         )
 
@@ -49,21 +60,137 @@ class MockRecord:
         """Return values for dict-like access."""
         return self._data.values()
 
+    def _serialize(self):
+        """Return record data with MagicMock values converted to strings, built once per change."""
+        if self._serialized is None:
+            # Convert MagicMock objects to strings for JSON serialization
+            self._serialized = {
+                key: str(value) if hasattr(value, "_mock_name") else value for key, value in self._data.items()
+            }
+        return self._serialized
+
     def items(self):
         """Return items for dict-like access."""
-        # Convert MagicMock objects to strings for JSON serialization
-        result = []
-        for key, value in self._data.items():
-            if hasattr(value, "__str__") and hasattr(value, "_mock_name"):
-                result.append((key, str(value)))
-            else:
-                result.append((key, value))
-        return result
+        return self._serialize().items()
 
     def __getitem__(self, key):
         """Get item by key for dict-like access."""
-        value = self._data[key]
-        # Convert MagicMock objects to strings for JSON serialization
-        if hasattr(value, "__str__") and hasattr(value, "_mock_name"):
-            return str(value)
-        return value
+        return self._serialize()[key]
+
+
+class FakeMCP:
+    """Minimal stand-in for FastMCP that records registered tool functions by name."""
+
+    def __init__(self):
+        """Initialize with no registered tools."""
+        self.tools = {}
+
+    def tool(self):
+        """Return a decorator that records the tool function and leaves it unchanged."""
+
+        def decorator(func):
+            self.tools[func.__name__] = func
+            return func
+
+        return decorator
+
+
+# Attributes of a pynautobot.api client; they are set in its __init__, so the class itself cannot serve as a spec
+CLIENT_ATTRIBUTES = (
+    "base_url",
+    "http_session",
+    "token",
+    "dcim",
+    "ipam",
+    "cloud",
+    "circuits",
+    "tenancy",
+    "extras",
+    "virtualization",
+    "users",
+    "wireless",
+    "plugins",
+    "graphql",
+)
+
+# Context logging methods the tools call; the real ones are async, so Context itself cannot serve as a spec
+CONTEXT_METHODS = ("debug", "info", "warning", "error")
+
+
+# Shared decoder so response parsing does not build a new JSONDecoder on every call
+_decode_json = json.JSONDecoder().decode
+
+
+def assert_response(result: str, **expected):
+    """Parse a tool's JSON response and check its top-level fields.
+
+    Args:
+        result: JSON string returned by a tool
+        **expected: Top-level fields the response must have, e.g. success=True
+
+    Returns:
+        The parsed response
+    """
+    parsed = _decode_json(result)
+    for key, value in expected.items():
+        assert parsed.get(key) == value, f"{key}={parsed.get(key)!r}, expected {value!r}"
+    return parsed
+
+
+def make_response(status_code: int, body: dict | None = None) -> SimpleNamespace:
+    """Build a minimal stand-in for a requests.Response as read by pynautobot.
+
+    Args:
+        status_code: HTTP status code of the response
+        body: JSON body returned by json(); defaults to an empty object
+
+    Returns:
+        Object with the response attributes pynautobot's Request and RequestError read
+    """
+    return SimpleNamespace(
+        status_code=status_code,
+        ok=status_code < 400,
+        reason="Error",
+        url="https://nautobot.example.com/api/",
+        text="",
+        request=SimpleNamespace(body=None),
+        json=lambda: {} if body is None else body,
+    )
+
+
+def make_request_error(status_code: int) -> RequestError:
+    """Build a pynautobot RequestError around a minimal stand-in for the failed HTTP response.
+
+    A fresh error is built per call; a shared instance would collect a traceback from every test that raises it.
+    """
+    return RequestError(make_response(status_code))
+
+
+@pytest.fixture
+def mock_client():
+    """Provide a fresh mock pynautobot client for each test.
+
+    The spec rejects attributes a real client does not have, so a mistyped app name fails the test.
+    """
+    return Mock(spec=CLIENT_ATTRIBUTES)
+
+
+@pytest.fixture
+def mock_context():
+    """Provide a fresh mock MCP context for each test.
+
+    A plain Mock limited to the logging methods the tools call is cheaper to build than a MagicMock.
+    """
+    return Mock(spec=CONTEXT_METHODS)
+
+
+@pytest.fixture(scope="module")
+def client_holder():
+    """Hold the current test's client for tool instances registered once per module."""
+    return SimpleNamespace(client=None)
+
+
+@pytest.fixture(autouse=True)
+def _bind_client(client_holder, mock_client):
+    """Point tools registered through client_holder at this test's mock client."""
+    client_holder.client = mock_client
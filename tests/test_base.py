@@ -1,10 +1,13 @@
 """Tests for NautobotToolBase class."""
 
 import json
+import logging
 import unittest
 from unittest.mock import Mock
 
-from nautobot_mcp_server.tools.base import NautobotToolBase
+from nautobot_mcp_server.tools.base import LOOKUP_CACHE_MAXSIZE, NautobotToolBase
+
+from .conftest import make_response
 
 
 class TestNautobotToolBase(unittest.TestCase):
@@ -109,3 +112,135 @@ class TestNautobotToolBase(unittest.TestCase):
         parsed = json.loads(result)
         self.assertIn("error", parsed)
         self.assertIn(str(error), parsed["error"])
+
+    def test_looks_like_uuid(self):
+        """Test UUIDs are told apart from object names."""
+        self.assertTrue(NautobotToolBase.looks_like_uuid("4f8a2a3e-6d55-4b2e-9c61-0c2c7a9e1b10"))
+        self.assertFalse(NautobotToolBase.looks_like_uuid("location-123"))
+        self.assertFalse(NautobotToolBase.looks_like_uuid(""))
+        self.assertFalse(NautobotToolBase.looks_like_uuid(None))
+
+    def test_get_record_by_id(self):
+        """Test UUID identifiers are looked up by ID only."""
+        endpoint = Mock()
+        record_id = "4f8a2a3e-6d55-4b2e-9c61-0c2c7a9e1b10"
+
+        result = NautobotToolBase.get_record(endpoint, record_id, depth=1)
+
+        self.assertEqual(result, endpoint.get.return_value)
+        endpoint.get.assert_called_once_with(id=record_id, depth=1)
+
+    def test_get_record_by_name(self):
+        """Test non-UUID identifiers are looked up by name only."""
+        endpoint = Mock()
+
+        result = NautobotToolBase.get_record(endpoint, "test-name")
+
+        self.assertEqual(result, endpoint.get.return_value)
+        endpoint.get.assert_called_once_with(name="test-name")
+
+    def test_resolve_id_caches_hits(self):
+        """Test resolved IDs are reused until invalidated."""
+        mock_client = Mock()
+        mock_client.extras.statuses.get.return_value = Mock(id="status-123")
+        tool = NautobotToolBase(lambda: mock_client)
+
+        self.assertEqual(tool.resolve_id("extras.statuses", name="Active"), "status-123")
+        self.assertEqual(tool.resolve_id("extras.statuses", name="Active"), "status-123")
+        mock_client.extras.statuses.get.assert_called_once_with(name="Active")
+
+        tool.invalidate_lookups("extras.statuses")
+        self.assertEqual(tool.resolve_id("extras.statuses", name="Active"), "status-123")
+        self.assertEqual(mock_client.extras.statuses.get.call_count, 2)
+
+    def test_resolve_id_does_not_cache_misses(self):
+        """Test failed lookups are retried on the next call."""
+        mock_client = Mock()
+        mock_client.extras.statuses.get.return_value = None
+        tool = NautobotToolBase(lambda: mock_client)
+
+        self.assertIsNone(tool.resolve_id("extras.statuses", name="Missing"))
+        self.assertIsNone(tool.resolve_id("extras.statuses", name="Missing"))
+        self.assertEqual(mock_client.extras.statuses.get.call_count, 2)
+
+    def test_resolve_id_cache_is_bounded(self):
+        """Test the lookup cache drops its oldest entries once it is full."""
+        mock_client = Mock()
+        mock_client.extras.statuses.get.return_value = Mock(id="status-123")
+        tool = NautobotToolBase(lambda: mock_client)
+
+        for index in range(LOOKUP_CACHE_MAXSIZE + 10):
+            tool.resolve_id("extras.statuses", name=f"status-{index}")
+
+        self.assertEqual(len(tool._lookup_cache), LOOKUP_CACHE_MAXSIZE)
+        self.assertNotIn(("extras.statuses", ("name", "status-0")), tool._lookup_cache)
+        self.assertIn(("extras.statuses", ("name", f"status-{LOOKUP_CACHE_MAXSIZE + 9}")), tool._lookup_cache)
+
+    def test_resolve_id_or_name(self):
+        """Test only UUID identifiers are resolved by ID."""
+        mock_client = Mock()
+        mock_client.dcim.location_types.get.return_value = Mock(id="type-123")
+        tool = NautobotToolBase(lambda: mock_client)
+        type_id = "9d3c1f4b-2a7e-4c8d-b5f6-1e0a9b8c7d6e"
+
+        tool.resolve_id_or_name("dcim.location_types", type_id)
+        tool.resolve_id_or_name("dcim.location_types", "Site")
+
+        calls = mock_client.dcim.location_types.get.call_args_list
+        self.assertEqual(calls[0][1], {"id": type_id})
+        self.assertEqual(calls[1][1], {"name": "Site"})
+
+    def test_delete_by_id(self):
+        """Test objects can be deleted by ID without being fetched."""
+        endpoint = Mock()
+
+        result = NautobotToolBase.delete_by_id(endpoint, "4f8a2a3e-6d55-4b2e-9c61-0c2c7a9e1b10")
+
+        self.assertEqual(result, endpoint.return_obj.return_value.delete.return_value)
+        endpoint.get.assert_not_called()
+        endpoint.return_obj.assert_called_once_with(
+            {"id": "4f8a2a3e-6d55-4b2e-9c61-0c2c7a9e1b10"}, endpoint.api, endpoint
+        )
+
+    def test_update_by_id(self):
+        """Test objects are patched by ID and the updated record from the response is returned."""
+        endpoint = Mock(url="https://nautobot.example.com/api/dcim/locations")
+        endpoint.api.api_version = None
+        endpoint.api.http_session.patch.return_value = make_response(200, {"id": "location-123", "name": "new"})
+        record_id = "4f8a2a3e-6d55-4b2e-9c61-0c2c7a9e1b10"
+
+        result = NautobotToolBase.update_by_id(endpoint, record_id, {"name": "new"})
+
+        self.assertEqual(result, endpoint.return_obj.return_value)
+        endpoint.get.assert_not_called()
+        endpoint.return_obj.assert_called_once_with({"id": "location-123", "name": "new"}, endpoint.api, endpoint)
+        self.assertEqual(
+            endpoint.api.http_session.patch.call_args.args,
+            (f"https://nautobot.example.com/api/dcim/locations/{record_id}/",),
+        )
+
+    def test_debug_skipped_when_debug_logging_disabled(self):
+        """Test debug messages are not built unless debug logging is enabled."""
+        ctx = Mock()
+        message = Mock(return_value="Looking up status")
+
+        logging.getLogger("nautobot_mcp_server.tools.base").setLevel(logging.INFO)
+        try:
+            NautobotToolBase._debug(ctx, message)
+        finally:
+            logging.getLogger("nautobot_mcp_server.tools.base").setLevel(logging.NOTSET)
+
+        message.assert_not_called()
+        ctx.debug.assert_not_called()
+
+    def test_debug_sent_when_debug_logging_enabled(self):
+        """Test debug messages are sent to the client when debug logging is enabled."""
+        ctx = Mock()
+
+        logging.getLogger("nautobot_mcp_server.tools.base").setLevel(logging.DEBUG)
+        try:
+            NautobotToolBase._debug(ctx, lambda: "Looking up status")
+        finally:
+            logging.getLogger("nautobot_mcp_server.tools.base").setLevel(logging.NOTSET)
+
+        ctx.debug.assert_called_once_with("Looking up status")
@@ -1,297 +1,567 @@
 """Tests for location management tools."""
 
-import json
-import unittest
 from unittest.mock import MagicMock
 
-from pynautobot import RequestError
+import pytest
 
 from nautobot_mcp_server.tools.locations import LocationTools
 
-from .conftest import MockRecord
-
-
-class TestLocationTools(unittest.TestCase):
-    """Test location management functionality."""
-
-    def setUp(self):
-        """Set up test fixtures using simple mocks."""
-        # Create mock client
-        self.mock_client = MagicMock()
-
-        # Create mock context
-        self.mock_context = MagicMock()
-
-        # Create location tools instance
-        self.location_tools = LocationTools(lambda: self.mock_client)
-
-        # Create simple mock location
-        self.mock_location = MockRecord(
-            id="location-123",
-            name="test-location",
-            location_type=MagicMock(__str__=lambda self: "Site"),
-            status=MagicMock(__str__=lambda self: "Active"),
-            parent=None,
-            description="Test location",
-            natural_slug="test-location",
-            created="2024-01-01T00:00:00Z",
-            url="https://nautobot.example.com/location/123",
-        )
-
-    def _register_and_get_function(self, function_index):
-        """Helper to register tools and get function."""
-        mcp_mock = MagicMock()
-        tool_decorator_mock = MagicMock()
-        mcp_mock.tool.return_value = tool_decorator_mock
-
-        self.location_tools.register(mcp_mock)
-
-        return tool_decorator_mock.call_args_list[function_index][0][0]
-
-    def test_list_locations_success(self):
-        """Test successful location listing."""
-        # Create another mock location
-        mock_location2 = MockRecord(
-            id="location-456",
-            name="test-location-2",
-            location_type=MagicMock(__str__=lambda self: "Building"),
-            status=MagicMock(__str__=lambda self: "Active"),
-            parent=MagicMock(__str__=lambda self: "test-location"),
-            description="Another location",
-        )
-
-        self.mock_client.dcim.locations.filter.return_value = [self.mock_location, mock_location2]
-
-        list_locations_func = self._register_and_get_function(0)
-        result = list_locations_func(self.mock_context, limit=10)
-
-        # Verify result
-        parsed = json.loads(result)
-        self.assertEqual(len(parsed), 2)
-        self.assertEqual(parsed[0]["name"], "test-location")
-        self.assertEqual(parsed[0]["id"], "location-123")
-        self.assertEqual(parsed[1]["name"], "test-location-2")
-
-        # Verify client was called correctly with depth and offset parameters
-        self.mock_client.dcim.locations.filter.assert_called_once_with(depth=1, limit=10, offset=None)
-        self.mock_context.info.assert_called()
-
-    def test_list_locations_with_status_filter(self):
-        """Test location listing with location_type filter."""
-        self.mock_client.dcim.locations.filter.return_value = []
-
-        list_locations_func = self._register_and_get_function(0)
-        result = list_locations_func(self.mock_context, limit=5, location_type="datacenter")
-
-        # Verify client was called with location_type filter and default parameters
-        self.mock_client.dcim.locations.filter.assert_called_once_with(
-            depth=1, limit=5, offset=None, location_type="datacenter"
-        )
-
-        # Verify empty result
-        parsed = json.loads(result)
-        self.assertEqual(parsed, [])
-
-    def test_list_locations_exception(self):
-        """Test location listing with exception."""
-        self.mock_client.dcim.locations.filter.side_effect = Exception("API Error")
-
-        list_locations_func = self._register_and_get_function(0)
-        result = list_locations_func(self.mock_context, limit=10)
-
-        # Verify error response
-        parsed = json.loads(result)
-        self.assertIn("error", parsed)
-        self.assertIn("API Error", parsed["error"])
-        self.mock_context.error.assert_called_once()
-
-    def test_get_location_success(self):
-        """Test successful location retrieval."""
-        self.mock_client.dcim.locations.get.return_value = self.mock_location
-
-        get_location_func = self._register_and_get_function(1)
-        result = get_location_func(self.mock_context, "location-123")
-
-        # Verify result
-        parsed = json.loads(result)
-        self.assertEqual(parsed["data"]["name"], "test-location")
-        self.assertEqual(parsed["data"]["id"], "location-123")
-        self.assertEqual(parsed["data"]["location_type"], "Site")
-
-        # Verify client was called correctly with depth parameter
-        self.mock_client.dcim.locations.get.assert_called_with(id="location-123", depth=1)
-
-    def test_get_location_not_found(self):
-        """Test location not found scenario."""
-        mock_request = MagicMock()
-        mock_request.status_code = 404
-        self.mock_client.dcim.locations.get.side_effect = [RequestError(mock_request), None]
-
-        get_location_func = self._register_and_get_function(1)
-        result = get_location_func(self.mock_context, "nonexistent-location")
-
-        # Verify error response
-        parsed = json.loads(result)
-        self.assertIn("error", parsed)
-        self.assertIn("Location not found", parsed["error"])
-
-    def test_create_location_success(self):
-        """Test successful location creation."""
-        # Mock related object lookups - first try ID lookup fails, then name lookup succeeds
-        mock_location_type = MockRecord(id="type-123")
-        self.mock_client.dcim.location_types.get.side_effect = [Exception("Not found by ID"), mock_location_type]
-
-        mock_status = MockRecord(id="status-123")
-        self.mock_client.extras.statuses.get.return_value = mock_status
-
-        # Mock location creation
-        self.mock_client.dcim.locations.create.return_value = self.mock_location
-
-        create_location_func = self._register_and_get_function(2)
-        result = create_location_func(self.mock_context, name="new-location", location_type="Site", status="active")
-
-        # Verify result
-        parsed = json.loads(result)
-        self.assertTrue(parsed["success"])
-        self.assertEqual(parsed["data"]["name"], "test-location")
-        self.assertIn("created successfully", parsed["message"])
-
-        # Verify lookups were performed - first ID, then name
-        calls = self.mock_client.dcim.location_types.get.call_args_list
-        self.assertEqual(len(calls), 2)
-        self.assertEqual(calls[0][1], {"id": "Site"})
-        self.assertEqual(calls[1][1], {"name": "Site"})
-        self.mock_client.extras.statuses.get.assert_called_once_with(name="active")
-
-    def test_create_location_missing_location_type(self):
-        """Test location creation with missing location type."""
-        self.mock_client.dcim.location_types.get.return_value = None
-
-        create_location_func = self._register_and_get_function(2)
-        result = create_location_func(self.mock_context, name="new-location", location_type="NonexistentType")
-
-        # Verify error response
-        parsed = json.loads(result)
-        self.assertIn("error", parsed)
-        self.assertIn("Location type not found", parsed["error"])
-
-    def test_update_location_success(self):
-        """Test successful location update."""
-        # Create a mock location with a mocked update method
-        from unittest.mock import MagicMock
-
-        mock_location = MockRecord(
-            id="location-123",
-            name="test-location",
-            location_type="Site",
-            status="active",
-            natural_slug="test-location",
-            url="http://nautobot/locations/location-123",
-        )
-        # Replace update method with a MagicMock to track calls
-        mock_location.update = MagicMock(side_effect=mock_location.update)
-
-        self.mock_client.dcim.locations.get.return_value = mock_location
-
-        update_location_func = self._register_and_get_function(3)
-        result = update_location_func(
-            self.mock_context,
-            location_id="location-123",
-            updates={"status": "maintenance", "description": "Updated description"},
-        )
-
-        # Verify result
-        parsed = json.loads(result)
-        self.assertTrue(parsed["success"])
-        self.assertEqual(parsed["data"]["name"], "test-location")
-        self.assertIn("status", parsed["data"]["updated_fields"])
-        self.assertIn("description", parsed["data"]["updated_fields"])
-
-        # Verify location was saved
-        self.assertTrue(hasattr(mock_location, "update"))
-
-    def test_update_location_with_none_values(self):
-        """Test location update with None values to clear fields."""
-        # Create a mock location with a mocked update method
-        from unittest.mock import MagicMock
-
-        mock_location = MockRecord(
-            id="location-123",
-            name="test-location",
-            location_type="Site",
-            status="active",
-            natural_slug="test-location",
-            url="http://nautobot/locations/location-123",
-        )
-        # Replace update method with a MagicMock to track calls
-        mock_location.update = MagicMock(side_effect=mock_location.update)
-
-        self.mock_client.dcim.locations.get.return_value = mock_location
-
-        update_location_func = self._register_and_get_function(3)
-        result = update_location_func(
-            self.mock_context,
-            location_id="location-123",
-            updates={"facility": None, "contact_phone": None, "description": "Cleared some fields"},
-        )
-
-        # Verify result
-        parsed = json.loads(result)
-        self.assertTrue(parsed["success"])
-        self.assertEqual(parsed["data"]["name"], "test-location")
-        self.assertIn("facility", parsed["data"]["updated_fields"])
-        self.assertIn("contact_phone", parsed["data"]["updated_fields"])
-        self.assertIn("description", parsed["data"]["updated_fields"])
-        self.assertIn("facility", parsed["data"]["cleared_fields"])
-        self.assertIn("contact_phone", parsed["data"]["cleared_fields"])
-        self.assertNotIn("description", parsed["data"]["cleared_fields"])
-
-        # Verify update was called with None values
-        mock_location.update.assert_called_once()
-        update_args = mock_location.update.call_args[0][0]
-        self.assertIsNone(update_args["facility"])
-        self.assertIsNone(update_args["contact_phone"])
-        self.assertEqual(update_args["description"], "Cleared some fields")
-
-    def test_update_location_invalid_updates_parameter(self):
-        """Test location update with invalid updates parameter."""
-        self.mock_client.dcim.locations.get.return_value = self.mock_location
-
-        update_location_func = self._register_and_get_function(3)
-        result = update_location_func(
-            self.mock_context,
-            location_id="location-123",
-            updates="not a dictionary",  # Invalid parameter type
-        )
-
-        # Verify error response
-        parsed = json.loads(result)
-        self.assertIn("error", parsed)
-        self.assertIn("dictionary", parsed["error"])
-
-    def test_delete_location_success(self):
-        """Test successful location deletion."""
-        self.mock_client.dcim.locations.get.return_value = self.mock_location
-
-        delete_location_func = self._register_and_get_function(4)
-        result = delete_location_func(self.mock_context, "location-123")
-
-        # Verify result
-        parsed = json.loads(result)
-        self.assertTrue(parsed["success"])
-        self.assertEqual(parsed["data"]["deleted"], "test-location")
-        self.assertIn("deleted successfully", parsed["message"])
-
-    def test_delete_location_not_found(self):
-        """Test location deletion when location not found."""
-        mock_request = MagicMock()
-        mock_request.status_code = 404
-        self.mock_client.dcim.locations.get.side_effect = [RequestError(mock_request), None]
-
-        delete_location_func = self._register_and_get_function(4)
-        result = delete_location_func(self.mock_context, "nonexistent-location")
-
-        # Verify error response
-        parsed = json.loads(result)
-        self.assertIn("error", parsed)
-        self.assertIn("Location not found", parsed["error"])
+from .conftest import FakeMCP, MockRecord, assert_response, make_request_error, make_response
+
+LOCATION_UUID = "4f8a2a3e-6d55-4b2e-9c61-0c2c7a9e1b10"
+LOCATION_TYPE_UUID = "9d3c1f4b-2a7e-4c8d-b5f6-1e0a9b8c7d6e"
+LOCATIONS_URL = "https://nautobot.example.com/api/dcim/locations"
+
+
+def _mock_patch(locations, response):
+    """Answer PATCH requests sent through pynautobot's Request for the given endpoint with a canned response."""
+    locations.url = LOCATIONS_URL
+    locations.api.token = "test-token"  # noqa: S105
+    locations.api.api_version = None
+    locations.api.http_session.patch.return_value = response
+
+
+@pytest.fixture(scope="module")
+def mock_location():
+    """Build the sample location once per module; tests that update it build their own record."""
+    return MockRecord(
+        id="location-123",
+        name="test-location",
+        location_type="Site",
+        status="Active",
+        parent=None,
+        description="Test location",
+        natural_slug="test-location",
+        created="2024-01-01T00:00:00Z",
+        url="https://nautobot.example.com/location/123",
+    )
+
+
+@pytest.fixture(scope="module")
+def location_tools(client_holder):
+    """Create the location tools once per module, reading the client from the shared holder."""
+    return LocationTools(lambda: client_holder.client)
+
+
+@pytest.fixture(scope="module")
+def registered_tools(location_tools):
+    """Register the location tools once per module and return the tool functions keyed by name."""
+    mcp = FakeMCP()
+    location_tools.register(mcp)
+    return mcp.tools
+
+
+@pytest.fixture(autouse=True)
+def _clear_lookup_cache(location_tools):
+    """Drop IDs resolved by earlier tests so each test sees its own lookups."""
+    location_tools._lookup_cache.clear()
+
+
+def test_list_locations_success(mock_client, mock_context, registered_tools, mock_location):
+    """Test successful location listing."""
+    # Create another mock location
+    mock_location2 = MockRecord(
+        id="location-456",
+        name="test-location-2",
+        location_type="Building",
+        status="Active",
+        parent="test-location",
+        description="Another location",
+    )
+
+    mock_client.dcim.locations.filter.return_value = [mock_location, mock_location2]
+
+    list_locations_func = registered_tools["nautobot_list_locations"]
+    result = list_locations_func(mock_context, limit=10)
+
+    # Verify result
+    parsed = assert_response(result)
+    assert len(parsed) == 2
+    assert parsed[0]["name"] == "test-location"
+    assert parsed[0]["id"] == "location-123"
+    assert parsed[1]["name"] == "test-location-2"
+
+    # Verify client was called correctly with depth and offset parameters
+    mock_client.dcim.locations.filter.assert_called_once_with(depth=1, limit=10, offset=None)
+    mock_context.info.assert_called()
+
+
+def test_list_locations_with_location_type_filter(mock_client, mock_context, registered_tools):
+    """Test location listing with location_type filter."""
+    mock_client.dcim.locations.filter.return_value = []
+
+    list_locations_func = registered_tools["nautobot_list_locations"]
+    result = list_locations_func(mock_context, limit=5, location_type="datacenter")
+
+    # Verify client was called with location_type filter and default parameters
+    mock_client.dcim.locations.filter.assert_called_once_with(depth=1, limit=5, offset=None, location_type="datacenter")
+
+    # Verify empty result
+    parsed = assert_response(result)
+    assert parsed == []
+
+
+@pytest.mark.parametrize(
+    ("filters", "expected_filters"),
+    [
+        ({"status": "Active", "parent": "region-1", "tenant": None}, {"status": "Active", "parent": "region-1"}),
+        ({"location_type": "", "status": "", "parent": "region-1"}, {"parent": "region-1"}),
+    ],
+    ids=["provided", "falsy"],
+)
+def test_list_locations_with_filters(mock_client, mock_context, registered_tools, filters, expected_filters):
+    """Test only the list filters that were provided with a value are sent."""
+    mock_client.dcim.locations.filter.return_value = []
+
+    list_locations_func = registered_tools["nautobot_list_locations"]
+    list_locations_func(mock_context, **filters)
+
+    mock_client.dcim.locations.filter.assert_called_once_with(depth=1, limit=50, offset=None, **expected_filters)
+
+
+def test_list_locations_exception(mock_client, mock_context, registered_tools):
+    """Test location listing with exception."""
+    mock_client.dcim.locations.filter.side_effect = Exception("API Error")
+
+    list_locations_func = registered_tools["nautobot_list_locations"]
+    result = list_locations_func(mock_context, limit=10)
+
+    # Verify error response
+    parsed = assert_response(result)
+    assert "error" in parsed
+    assert "API Error" in parsed["error"]
+    mock_context.error.assert_called_once()
+
+
+def test_get_location_success(mock_client, mock_context, registered_tools, mock_location):
+    """Test successful location retrieval by ID."""
+    mock_client.dcim.locations.get.return_value = mock_location
+
+    get_location_func = registered_tools["nautobot_get_location"]
+    result = get_location_func(mock_context, LOCATION_UUID)
+
+    # Verify result
+    parsed = assert_response(result)
+    assert parsed["data"]["name"] == "test-location"
+    assert parsed["data"]["id"] == "location-123"
+    assert parsed["data"]["location_type"] == "Site"
+
+    # Verify client was called correctly with depth parameter
+    mock_client.dcim.locations.get.assert_called_once_with(id=LOCATION_UUID, depth=1)
+
+
+def test_get_location_by_name(mock_client, mock_context, registered_tools, mock_location):
+    """Test location retrieval by name skips the ID lookup."""
+    mock_client.dcim.locations.get.return_value = mock_location
+
+    get_location_func = registered_tools["nautobot_get_location"]
+    result = get_location_func(mock_context, "test-location")
+
+    # Verify result
+    parsed = assert_response(result, success=True)
+    assert parsed["data"]["name"] == "test-location"
+
+    # Verify only the name lookup was made
+    mock_client.dcim.locations.get.assert_called_once_with(name="test-location", depth=1)
+
+
+def test_create_location_success(mock_client, mock_context, registered_tools, mock_location):
+    """Test successful location creation."""
+    # Mock related object lookups
+    mock_location_type = MockRecord(id="type-123")
+    mock_client.dcim.location_types.get.return_value = mock_location_type
+
+    mock_status = MockRecord(id="status-123")
+    mock_client.extras.statuses.get.return_value = mock_status
+
+    # Mock location creation
+    mock_client.dcim.locations.create.return_value = mock_location
+
+    create_location_func = registered_tools["nautobot_create_location"]
+    result = create_location_func(mock_context, name="new-location", location_type="Site", status="active")
+
+    # Verify result
+    parsed = assert_response(result, success=True)
+    assert parsed["data"]["name"] == "test-location"
+    assert "created successfully" in parsed["message"]
+
+    # Verify a non-UUID location type is looked up by name only
+    mock_client.dcim.location_types.get.assert_called_once_with(name="Site")
+    mock_client.extras.statuses.get.assert_called_once_with(name="active")
+
+
+def test_create_location_with_optional_fields(mock_client, mock_context, registered_tools, mock_location):
+    """Test only the optional fields that were provided are sent."""
+    mock_client.dcim.location_types.get.return_value = MockRecord(id="type-123")
+    mock_client.extras.statuses.get.return_value = MockRecord(id="status-123")
+    mock_client.dcim.locations.create.return_value = mock_location
+
+    create_location_func = registered_tools["nautobot_create_location"]
+    create_location_func(
+        mock_context, name="new-location", location_type="Site", facility="DC01", asn=65000, time_zone=None
+    )
+
+    mock_client.dcim.locations.create.assert_called_once_with(
+        name="new-location", location_type="type-123", status="status-123", facility="DC01", asn=65000
+    )
+
+
+def test_create_location_reuses_cached_lookups(mock_client, mock_context, registered_tools, mock_location):
+    """Test repeated creates reuse resolved status and location type IDs."""
+    mock_client.dcim.location_types.get.return_value = MockRecord(id="type-123")
+    mock_client.extras.statuses.get.return_value = MockRecord(id="status-123")
+    mock_client.dcim.locations.create.return_value = mock_location
+
+    create_location_func = registered_tools["nautobot_create_location"]
+    create_location_func(mock_context, name="new-location-1", location_type=LOCATION_TYPE_UUID)
+    create_location_func(mock_context, name="new-location-2", location_type=LOCATION_TYPE_UUID)
+
+    # Verify each lookup hit the API once, but both creates used the resolved IDs
+    mock_client.dcim.location_types.get.assert_called_once_with(id=LOCATION_TYPE_UUID)
+    mock_client.extras.statuses.get.assert_called_once_with(name="active")
+    mock_client.dcim.locations.create.assert_called_with(
+        name="new-location-2", location_type="type-123", status="status-123"
+    )
+
+
+def test_create_location_with_parent(mock_client, mock_context, registered_tools, mock_location):
+    """Test location creation resolves the parent alongside the other lookups."""
+    mock_client.dcim.location_types.get.return_value = MockRecord(id="type-123")
+    mock_client.extras.statuses.get.return_value = MockRecord(id="status-123")
+    mock_client.dcim.locations.get.return_value = MockRecord(id="parent-123")
+    mock_client.dcim.locations.create.return_value = mock_location
+
+    create_location_func = registered_tools["nautobot_create_location"]
+    result = create_location_func(mock_context, name="new-location", location_type="type-123", parent="parent-location")
+
+    # Verify result and that the resolved IDs were sent
+    assert_response(result, success=True)
+    mock_client.dcim.locations.get.assert_called_once_with(name="parent-location")
+    mock_client.dcim.locations.create.assert_called_once_with(
+        name="new-location", location_type="type-123", status="status-123", parent="parent-123"
+    )
+
+
+def test_create_location_parent_not_found(mock_client, mock_context, registered_tools):
+    """Test location creation with an unknown parent."""
+    mock_client.dcim.location_types.get.return_value = MockRecord(id="type-123")
+    mock_client.extras.statuses.get.return_value = MockRecord(id="status-123")
+    mock_client.dcim.locations.get.return_value = None
+
+    create_location_func = registered_tools["nautobot_create_location"]
+    result = create_location_func(mock_context, name="new-location", location_type="Site", parent="missing-parent")
+
+    # Verify error response and that nothing was created
+    parsed = assert_response(result)
+    assert "error" in parsed
+    assert "Parent location not found" in parsed["error"]
+    mock_client.dcim.locations.create.assert_not_called()
+
+
+def test_create_location_missing_location_type(mock_client, mock_context, registered_tools):
+    """Test location creation with missing location type."""
+    mock_client.dcim.location_types.get.return_value = None
+
+    create_location_func = registered_tools["nautobot_create_location"]
+    result = create_location_func(mock_context, name="new-location", location_type="NonexistentType")
+
+    # Verify error response
+    parsed = assert_response(result)
+    assert "error" in parsed
+    assert "Location type not found" in parsed["error"]
+
+
+def test_bulk_create_locations_success(mock_client, mock_context, registered_tools):
+    """Test bulk creation resolves shared lookups once and sends a single request."""
+    mock_client.dcim.location_types.get.return_value = MockRecord(id="type-123")
+    mock_client.extras.statuses.get.return_value = MockRecord(id="status-123")
+    mock_client.dcim.locations.get.return_value = MockRecord(id="parent-123")
+    mock_client.dcim.locations.create.return_value = [
+        MockRecord(id="location-1", name="site-1"),
+        MockRecord(id="location-2", name="site-2"),
+    ]
+
+    bulk_create_func = registered_tools["nautobot_bulk_create_locations"]
+    result = bulk_create_func(
+        mock_context,
+        locations=[
+            {"name": "site-1", "facility": "DC01", "parent": "region-1"},
+            {"name": "site-2", "parent": "region-1", "description": None},
+        ],
+        location_type="Site",
+    )
+
+    # Verify result
+    parsed = assert_response(result, success=True)
+    assert parsed["data"] == [{"id": "location-1", "name": "site-1"}, {"id": "location-2", "name": "site-2"}]
+
+    # Verify each lookup ran once and all locations were sent in one request
+    mock_client.dcim.location_types.get.assert_called_once_with(name="Site")
+    mock_client.extras.statuses.get.assert_called_once_with(name="active")
+    mock_client.dcim.locations.get.assert_called_once_with(name="region-1")
+    mock_client.dcim.locations.create.assert_called_once_with(
+        [
+            {
+                "name": "site-1",
+                "location_type": "type-123",
+                "status": "status-123",
+                "facility": "DC01",
+                "parent": "parent-123",
+            },
+            {"name": "site-2", "location_type": "type-123", "status": "status-123", "parent": "parent-123"},
+        ]
+    )
+
+
+def test_bulk_create_locations_parent_not_found(mock_client, mock_context, registered_tools):
+    """Test bulk creation with an unknown parent creates nothing."""
+    mock_client.dcim.location_types.get.return_value = MockRecord(id="type-123")
+    mock_client.extras.statuses.get.return_value = MockRecord(id="status-123")
+    mock_client.dcim.locations.get.return_value = None
+
+    bulk_create_func = registered_tools["nautobot_bulk_create_locations"]
+    result = bulk_create_func(
+        mock_context, locations=[{"name": "site-1", "parent": "missing-parent"}], location_type="Site"
+    )
+
+    # Verify error response and that nothing was created
+    parsed = assert_response(result)
+    assert "Parent locations not found: missing-parent" in parsed["error"]
+    mock_client.dcim.locations.create.assert_not_called()
+
+
+def test_bulk_create_locations_requires_names(mock_client, mock_context, registered_tools):
+    """Test bulk creation validates input before any API calls."""
+    bulk_create_func = registered_tools["nautobot_bulk_create_locations"]
+    result = bulk_create_func(mock_context, locations=[{"facility": "DC01"}], location_type="Site")
+
+    # Verify error response and that the API was not called
+    parsed = assert_response(result)
+    assert "must be a dictionary with a name" in parsed["error"]
+    mock_client.extras.statuses.get.assert_not_called()
+    mock_client.dcim.locations.create.assert_not_called()
+
+
+def test_bulk_create_locations_rejects_unknown_fields(mock_client, mock_context, registered_tools):
+    """Test bulk creation rejects per-entry fields it would otherwise drop."""
+    bulk_create_func = registered_tools["nautobot_bulk_create_locations"]
+    result = bulk_create_func(
+        mock_context,
+        locations=[{"name": "site-1", "tenant": "acme", "status": "planned", "location_type": "Building"}],
+        location_type="Site",
+    )
+
+    # Verify error response names the unknown fields and that the API was not called
+    parsed = assert_response(result)
+    assert parsed["error"] == "Unsupported fields for location site-1: location_type, status, tenant"
+    mock_client.extras.statuses.get.assert_not_called()
+    mock_client.dcim.locations.create.assert_not_called()
+
+
+def test_update_location_success(mock_client, mock_context, registered_tools):
+    """Test successful location update."""
+    # Create a mock location with a mocked update method
+    mock_location = MockRecord(
+        id="location-123",
+        name="test-location",
+        location_type="Site",
+        status="active",
+        natural_slug="test-location",
+        url="http://nautobot/locations/location-123",
+    )
+    # Replace update method with a MagicMock to track calls
+    mock_location.update = MagicMock(side_effect=mock_location.update)
+
+    mock_client.dcim.locations.get.return_value = mock_location
+
+    update_location_func = registered_tools["nautobot_update_location"]
+    result = update_location_func(
+        mock_context,
+        location_id="location-123",
+        updates={"status": "maintenance", "description": "Updated description"},
+    )
+
+    # Verify result
+    parsed = assert_response(result, success=True)
+    assert parsed["data"]["name"] == "test-location"
+    assert "status" in parsed["data"]["updated_fields"]
+    assert "description" in parsed["data"]["updated_fields"]
+
+    # Verify the normalized updates were saved to the location
+    mock_location.update.assert_called_once_with({"status": "Maintenance", "description": "Updated description"})
+
+
+def test_update_location_with_none_values(mock_client, mock_context, registered_tools):
+    """Test location update with None values to clear fields."""
+    # Create a mock location with a mocked update method
+    mock_location = MockRecord(
+        id="location-123",
+        name="test-location",
+        location_type="Site",
+        status="active",
+        natural_slug="test-location",
+        url="http://nautobot/locations/location-123",
+    )
+    # Replace update method with a MagicMock to track calls
+    mock_location.update = MagicMock(side_effect=mock_location.update)
+
+    mock_client.dcim.locations.get.return_value = mock_location
+
+    update_location_func = registered_tools["nautobot_update_location"]
+    result = update_location_func(
+        mock_context,
+        location_id="location-123",
+        updates={"facility": None, "contact_phone": None, "description": "Cleared some fields"},
+    )
+
+    # Verify result
+    parsed = assert_response(result, success=True)
+    assert parsed["data"]["name"] == "test-location"
+    assert "facility" in parsed["data"]["updated_fields"]
+    assert "contact_phone" in parsed["data"]["updated_fields"]
+    assert "description" in parsed["data"]["updated_fields"]
+    assert "facility" in parsed["data"]["cleared_fields"]
+    assert "contact_phone" in parsed["data"]["cleared_fields"]
+    assert "description" not in parsed["data"]["cleared_fields"]
+
+    # Verify update was called with None values
+    mock_location.update.assert_called_once()
+    update_args = mock_location.update.call_args[0][0]
+    assert update_args["facility"] is None
+    assert update_args["contact_phone"] is None
+    assert update_args["description"] == "Cleared some fields"
+
+
+def test_update_location_by_id_skips_lookup(mock_client, mock_context, registered_tools):
+    """Test updating by UUID issues the PATCH without fetching the location."""
+    locations = mock_client.dcim.locations
+    _mock_patch(
+        locations,
+        make_response(
+            200,
+            {"id": LOCATION_UUID, "name": "test-location", "natural_slug": "test-location", "status": "Planned"},
+        ),
+    )
+    locations.return_obj.side_effect = lambda values, api, endpoint: MockRecord(**values)
+
+    update_location_func = registered_tools["nautobot_update_location"]
+    result = update_location_func(
+        mock_context, location_id=LOCATION_UUID, updates={"status": "planned", "facility": None}
+    )
+
+    # Verify the response is built from the record the PATCH returned
+    parsed = assert_response(result, success=True, message="Location updated successfully")
+    assert parsed["data"] == {
+        "id": LOCATION_UUID,
+        "name": "test-location",
+        "natural_slug": "test-location",
+        "status": "Planned",
+        "updated_fields": ["status", "facility"],
+        "cleared_fields": ["facility"],
+    }
+
+    # Verify the PATCH went straight to the ID
+    locations.get.assert_not_called()
+    locations.api.http_session.patch.assert_called_once()
+    assert locations.api.http_session.patch.call_args.args == (f"{LOCATIONS_URL}/{LOCATION_UUID}/",)
+    assert locations.api.http_session.patch.call_args.kwargs["json"] == {"status": "Planned", "facility": None}
+
+
+def test_update_location_not_found(mock_client, mock_context, registered_tools):
+    """Test location update when location not found."""
+    mock_client.dcim.locations.get.return_value = None
+
+    update_location_func = registered_tools["nautobot_update_location"]
+    result = update_location_func(mock_context, location_id="missing-location", updates={"status": "planned"})
+
+    # Verify error response
+    parsed = assert_response(result)
+    assert "error" in parsed
+    assert "Location not found" in parsed["error"]
+    mock_client.dcim.locations.get.assert_called_once_with(name="missing-location")
+    mock_client.dcim.locations.api.http_session.patch.assert_not_called()
+
+
+def test_update_location_invalid_updates_parameter(mock_client, mock_context, registered_tools):
+    """Test location update with invalid updates parameter."""
+    update_location_func = registered_tools["nautobot_update_location"]
+    result = update_location_func(
+        mock_context,
+        location_id="location-123",
+        updates="not a dictionary",  # Invalid parameter type
+    )
+
+    # Verify error response
+    parsed = assert_response(result)
+    assert "error" in parsed
+    assert "dictionary" in parsed["error"]
+    mock_client.dcim.locations.get.assert_not_called()
+
+
+def test_update_location_empty_updates(mock_client, mock_context, registered_tools):
+    """Test location update with no fields skips all API calls."""
+    update_location_func = registered_tools["nautobot_update_location"]
+    result = update_location_func(mock_context, location_id=LOCATION_UUID, updates={})
+
+    # Verify error response
+    parsed = assert_response(result)
+    assert "error" in parsed
+    assert "No fields to update" in parsed["error"]
+    mock_client.dcim.locations.get.assert_not_called()
+
+
+def test_delete_location_success(mock_client, mock_context, registered_tools, mock_location):
+    """Test successful location deletion."""
+    mock_client.dcim.locations.get.return_value = mock_location
+
+    delete_location_func = registered_tools["nautobot_delete_location"]
+    result = delete_location_func(mock_context, "location-123")
+
+    # Verify result
+    parsed = assert_response(result, success=True)
+    assert parsed["data"]["deleted"] == "test-location"
+    assert "deleted successfully" in parsed["message"]
+
+    # Verify the location was looked up by name
+    mock_client.dcim.locations.get.assert_called_once_with(name="location-123")
+
+
+def test_delete_location_by_id_skips_lookup(mock_client, mock_context, registered_tools):
+    """Test deleting by UUID issues the DELETE without fetching the location."""
+    delete_location_func = registered_tools["nautobot_delete_location"]
+    result = delete_location_func(mock_context, LOCATION_UUID)
+
+    # Verify result
+    parsed = assert_response(result, success=True)
+    assert parsed["data"]["deleted"] == LOCATION_UUID
+
+    # Verify the DELETE went straight to the ID
+    locations = mock_client.dcim.locations
+    locations.get.assert_not_called()
+    locations.return_obj.assert_called_once_with({"id": LOCATION_UUID}, locations.api, locations)
+    locations.return_obj.return_value.delete.assert_called_once_with()
+
+
+@pytest.mark.parametrize(
+    ("tool_name", "kwargs"),
+    [
+        ("nautobot_get_location", {"location_id": "missing-location"}),
+        ("nautobot_update_location", {"location_id": LOCATION_UUID, "updates": {"status": "planned"}}),
+        ("nautobot_delete_location", {"location_id": "missing-location"}),
+        ("nautobot_delete_location", {"location_id": LOCATION_UUID}),
+    ],
+    ids=["get_by_name", "update_by_id", "delete_by_name", "delete_by_id"],
+)
+def test_location_not_found(mock_client, mock_context, registered_tools, tool_name, kwargs):
+    """Test unknown names and UUIDs are reported as location not found."""
+    locations = mock_client.dcim.locations
+    locations.get.return_value = None
+    _mock_patch(locations, make_response(404))
+    locations.return_obj.return_value.delete.side_effect = make_request_error(404)
+
+    result = registered_tools[tool_name](mock_context, **kwargs)
+
+    # Verify error response
+    parsed = assert_response(result)
+    assert "error" in parsed
+    assert "Location not found" in parsed["error"]
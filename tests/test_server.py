@@ -0,0 +1,67 @@
+"""Tests for the NautobotMCPServer class."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+from nautobot_mcp_server.server import HTTP_POOL_MAXSIZE, HTTP_RETRY, NautobotMCPServer
+
+
+@pytest.fixture
+def http_session():
+    """Provide the session the patched client uses, with the adapter pynautobot mounts for retries=3."""
+    session = requests.Session()
+    constructor_adapter = HTTPAdapter(max_retries=3)
+    session.mount("http://", constructor_adapter)
+    session.mount("https://", constructor_adapter)
+    return session
+
+
+@pytest.fixture
+def mock_api(http_session):
+    """Patch pynautobot.api so no request is sent to a real Nautobot."""
+    with patch("nautobot_mcp_server.server.pynautobot.api") as mock_api:
+        mock_api.return_value = MagicMock(http_session=http_session)
+        yield mock_api
+
+
+@pytest.fixture
+def server(mock_api):
+    """Provide a server whose pynautobot client is patched."""
+    return NautobotMCPServer(url="http://nautobot.example.com", token="test-token")  # noqa: S106
+
+
+def test_get_client_is_reused(server, mock_api):
+    """Test the pynautobot client is created once and shared."""
+    client = server._get_client()
+
+    assert server._get_client() is client
+    mock_api.assert_called_once_with(
+        "http://nautobot.example.com",
+        token="test-token",  # noqa: S106
+        threading=True,
+        retries=3,
+    )
+
+
+def test_get_client_replaces_constructor_adapter(server):
+    """Test the adapter used for the constructor's version check is replaced once the client exists."""
+    session = server._get_client().http_session
+
+    for prefix in ("http://", "https://"):
+        assert session.get_adapter(prefix + "nautobot.example.com").max_retries is HTTP_RETRY
+
+
+def test_get_client_mounts_pooled_adapter(server):
+    """Test the client's session uses the shared pooled, retrying adapter."""
+    session = server._get_client().http_session
+
+    for prefix in ("http://", "https://"):
+        adapter = session.get_adapter(prefix + "nautobot.example.com")
+        assert adapter._pool_maxsize == HTTP_POOL_MAXSIZE
+        assert adapter.max_retries.total == 3
+        assert 503 in adapter.max_retries.status_forcelist
+        assert "POST" not in adapter.max_retries.allowed_methods
+        assert not adapter.max_retries.raise_on_status